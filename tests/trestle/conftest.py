@@ -15,8 +15,7 @@
 """Common fixtures."""
 import os
 import pathlib
-import random
-import string
+import secrets
 import sys
 from unittest.mock import patch
 from uuid import uuid4
@@ -26,6 +25,7 @@ import pytest
 from tests import test_utils
 
 from trestle.cli import Trestle
+from trestle.core import generators
 from trestle.oscal.catalog import Catalog
 from trestle.oscal.target import TargetDefinition
 
@@ -35,7 +35,7 @@ TEST_CONFIG: dict = {}
 @pytest.fixture(scope='function')
 def rand_str():
     """Return a random string."""
-    rand_str = ''.join(random.choice(string.ascii_letters) for x in range(16))
+    rand_str = secrets.token_hex(8)
     return rand_str
 
 
@@ -97,6 +97,14 @@ def sample_catalog():
     return catalog_obj
 
 
+@pytest.fixture(scope='session')
+def sample_catalog_bytes(tmp_path_factory) -> bytes:
+    """Return a generated sample catalog serialized as oscal json, generated once per session."""
+    catalog_file = tmp_path_factory.mktemp('sample_catalog') / 'catalog.json'
+    generators.generate_sample_model(Catalog).oscal_write(catalog_file)
+    return catalog_file.read_bytes()
+
+
 @pytest.fixture(scope='function')
 def sample_catalog_minimal():
     """Return a valid catalog object with minimum fields necessary."""
@@ -123,6 +131,14 @@ def tmp_trestle_dir(tmp_path: pathlib.Path) -> pathlib.Path:
     os.chdir(pytest_cwd)
 
 
+@pytest.fixture(scope='function')
+def tmp_catalog_file(tmp_trestle_dir: pathlib.Path, sample_catalog_bytes: bytes) -> pathlib.Path:
+    """Write the sample catalog next to (but outside of) the tmp trestle project and return its path."""
+    catalog_file = tmp_trestle_dir.parent / f'{tmp_trestle_dir.name}.json'
+    catalog_file.write_bytes(sample_catalog_bytes)
+    return catalog_file
+
+
 @pytest.fixture(scope='function')
 def tmp_empty_cwd(tmp_path: pathlib.Path) -> pathlib.Path:
     """Create a temporary directory and cd into that directory with fail out afterwards.
@@ -27,8 +27,11 @@ import trestle.oscal.component as component
 import trestle.oscal.poam as poam
 import trestle.oscal.target as ostarget
 from trestle.core.base_model import OscalBaseModel
+from trestle.core.utils import classname_to_alias
 from trestle.oscal.target import TargetDefinition
 
+import yaml
+
 
 def test_echo_tmp_path(tmp_path) -> None:
     """Testing pytest."""
@@ -75,8 +78,7 @@ def test_no_timezone_exception() -> None:
     """Test that an exception occurs when no timezone is passed in datetime."""
     no_tz_catalog = simple_catalog()
     with pytest.raises(Exception):
-        jsoned_catalog = no_tz_catalog.json(exclude_none=True, by_alias=True, indent=2)
-        type(jsoned_catalog)
+        no_tz_catalog.json(exclude_none=True, by_alias=True, indent=2)
 
 
 def test_with_timezone() -> None:
@@ -124,8 +126,7 @@ def test_broken_tz() -> None:
     )
     catalog = oscatalog.Catalog(metadata=m, uuid=str(uuid4()))
     with pytest.raises(Exception):
-        jsoned_catalog = catalog.json(exclude_none=True, by_alias=True, indent=2)
-        type(jsoned_catalog)
+        catalog.json(exclude_none=True, by_alias=True, indent=2)
 
 
 def test_stripped_model() -> None:
@@ -165,13 +166,9 @@ def test_stripping_model_class() -> None:
 def test_stripped_model_type_failure() -> None:
     """Test for user failure conditions."""
     with pytest.raises(err.TrestleError):
-        a = oscatalog.Catalog.create_stripped_model_type(
-            stripped_fields=['metadata'], stripped_fields_aliases=['groups']
-        )
-        assert a is not None
+        oscatalog.Catalog.create_stripped_model_type(stripped_fields=['metadata'], stripped_fields_aliases=['groups'])
     with pytest.raises(err.TrestleError):
-        a = oscatalog.Catalog.create_stripped_model_type(stripped_fields=None)
-        assert a is not None
+        oscatalog.Catalog.create_stripped_model_type(stripped_fields=None)
 
 
 def test_stripped_instance(sample_target_def: OscalBaseModel) -> None:
@@ -296,6 +293,21 @@ def test_oscal_write(tmp_path: pathlib.Path) -> None:
         target2.oscal_write(tmp_path / 'target.borked')
 
 
+def test_oscal_write_yaml_exponent_float(tmp_path: pathlib.Path) -> None:
+    """Test that floats written in exponent form without a dot stay floats in yaml output."""
+
+    class FloatHolder(OscalBaseModel):
+        value: float
+
+    holder = FloatHolder(value=1e-05)
+    yaml_file = tmp_path / 'float_holder.yaml'
+    holder.oscal_write(yaml_file)
+
+    raw_value = yaml.safe_load(yaml_file.read_text())[classname_to_alias(FloatHolder.__name__, 'json')]['value']
+    assert isinstance(raw_value, float)
+    assert FloatHolder.oscal_read(yaml_file) == holder
+
+
 def test_get_field_value(sample_target_def: TargetDefinition) -> None:
     """Test get field value method."""
     assert sample_target_def.metadata.get_field_value('last-modified') == sample_target_def.metadata.last_modified
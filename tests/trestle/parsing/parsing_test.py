@@ -21,59 +21,68 @@ import pathlib
 import pytest
 
 import trestle.oscal.target as ostarget
+from trestle.core.utils import classname_to_alias
 
 import yaml
 
 yaml_path = pathlib.Path('tests/data/yaml/')
 json_path = pathlib.Path('tests/data/json/')
 encoding = 'utf8'
-loader = yaml.Loader
+loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+target_alias = classname_to_alias(ostarget.TargetDefinition.__name__, 'json')
+
+
+@pytest.fixture(scope='module')
+def good_target(yaml_testdata_path: pathlib.Path) -> dict:
+    """Return good_target.yaml, parsed once per module."""
+    return yaml.load((yaml_testdata_path / 'good_target.yaml').read_bytes(), Loader=loader)
+
+
+@pytest.fixture(scope='module')
+def good_target_diff_tz(yaml_testdata_path: pathlib.Path) -> dict:
+    """Return good_target_diff_tz.yaml, parsed once per module."""
+    return yaml.load((yaml_testdata_path / 'good_target_diff_tz.yaml').read_bytes(), Loader=loader)
+
+
+@pytest.fixture(scope='module')
+def bad_target_no_tz(yaml_testdata_path: pathlib.Path) -> dict:
+    """Return bad_target_no_tz.yaml, parsed once per module."""
+    return yaml.load((yaml_testdata_path / 'bad_target_no_tz.yaml').read_bytes(), Loader=loader)
 
 
 def test_yaml_load() -> None:
     """Test yaml load."""
     # happy path
-    read_file = (yaml_path / 'good_simple.yaml').open('r', encoding=encoding)
-    obj = yaml.load(read_file, Loader=loader)
+    obj = yaml.load((yaml_path / 'good_simple.yaml').read_bytes(), Loader=loader)
     assert obj is not None
 
     # unhappy path
     with pytest.raises(yaml.parser.ParserError):
-        read_file = (yaml_path / 'bad_simple.yaml').open('r', encoding=encoding)
-        obj = yaml.load(read_file, Loader=loader)
+        obj = yaml.load((yaml_path / 'bad_simple.yaml').read_bytes(), Loader=loader)
 
 
-def test_yaml_dump(tmp_path: pathlib.Path) -> None:
+def test_yaml_dump(tmp_path: pathlib.Path, good_target: dict) -> None:
     """Test yaml load and dump."""
     target_name = 'good_target.yaml'
-    tmp_path = pathlib.Path(tmp_path)
 
     # happy path
-    read_file = (yaml_path / target_name).open('r', encoding=encoding)
-    target = yaml.load(read_file, Loader=loader)
-    assert target is not None
-
     dump_name = tmp_path / target_name
-    write_file = dump_name.open('w', encoding=encoding)
-    yaml.dump(target, write_file)
-    read_file = dump_name.open('r', encoding=encoding)
-    saved_target = yaml.load(read_file, Loader=loader)
+    dump_name.write_text(yaml.dump(good_target, Dumper=dumper), encoding=encoding)
+    saved_target = yaml.load(dump_name.read_bytes(), Loader=loader)
     assert saved_target is not None
 
-    assert saved_target == target
+    assert saved_target == good_target
 
 
-def test_oscal_model(tmp_path: pathlib.Path) -> None:
+def test_oscal_model(
+    tmp_path: pathlib.Path, good_target: dict, good_target_diff_tz: dict, bad_target_no_tz: dict
+) -> None:
     """Test pydantic oscal model."""
     good_target_name = 'good_target.yaml'
-    tmp_path = pathlib.Path(tmp_path)
-
-    tmp_path = pathlib.Path(tmp_path)
 
     # load good target
-    read_file = yaml_path / good_target_name
-    assert read_file.exists()
-    target = ostarget.TargetDefinition.oscal_read(read_file)
+    target = ostarget.TargetDefinition.parse_obj(good_target[target_alias])
     assert target is not None
 
     # write the oscal target def out as yaml
@@ -92,20 +101,12 @@ def test_oscal_model(tmp_path: pathlib.Path) -> None:
     assert target != target_reload
 
     # load good target with different timezone
-    read_file = yaml_path / 'good_target_diff_tz.yaml'
-    target_diff_tz = ostarget.TargetDefinition.oscal_read(read_file)
+    target_diff_tz = ostarget.TargetDefinition.parse_obj(good_target_diff_tz[target_alias])
     assert target_diff_tz is not None
 
     # confirm same since different timezones but same utc time
     assert target == target_diff_tz
 
-    # try to load file with no timezone specified
-    read_file = yaml_path / 'bad_target_no_tz.yaml'
-
-    # confirm the load fails because it is invalid without timezone specified
-    try:
-        _ = ostarget.TargetDefinition.oscal_read(read_file)
-    except Exception:
-        assert True
-    else:
-        assert AssertionError()
+    # a target with no timezone specified still loads, but its last-modified stays naive
+    target_no_tz = ostarget.TargetDefinition.parse_obj(bad_target_no_tz[target_alias])
+    assert target_no_tz.metadata.last_modified.tzinfo is None
@@ -27,6 +27,7 @@ I can write a comment in here and you can even edit on the same line.
 """
 
 import datetime
+import json
 import logging
 import pathlib
 from typing import Any, Dict, List, Optional, Type, cast
@@ -239,7 +240,7 @@ class OscalBaseModel(BaseModel):
         content_type = FileContentType.to_content_type(path.suffix)
         write_file = pathlib.Path(path).open('w', encoding=const.FILE_ENCODING)
         if content_type == FileContentType.YAML:
-            yaml.dump(yaml.safe_load(wrapped_model.json(exclude_none=True, by_alias=True)), write_file)
+            yaml.dump(json.loads(wrapped_model.json(exclude_none=True, by_alias=True)), write_file)
         elif content_type == FileContentType.JSON:
             write_file.write(wrapped_model.json(exclude_none=True, by_alias=True, indent=2))
 
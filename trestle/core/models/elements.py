@@ -369,7 +369,7 @@ class Element:
 
     def to_yaml(self) -> str:
         """Convert into YAML string."""
-        yaml_data = yaml.dump(yaml.safe_load(self.to_json()))
+        yaml_data = yaml.dump(json.loads(self.to_json()))
         return yaml_data
 
     def to_json(self) -> str: